@@ -1,3 +1,5 @@
+from data_processor import DataProcessor
+
 class AISuggestionEngine:
     """
     Generates AI-like strategic suggestions based on calculated metrics.
@@ -114,8 +116,113 @@ class AISuggestionEngine:
                             f"Implement strategies to convert these users to **Standard or Premium memberships** for more predictable recurring revenue and increased loyalty."
                         )
 
+        # Trend-aware suggestions from week-over-week / month-over-month deltas
+        suggestions.extend(self._generate_trend_suggestions(metrics.get('period_deltas') or {}))
+
         # Fallback if no specific suggestions were generated (e.g., minimal data)
         if not suggestions:
              return ["Analyzing data... More insights will appear as data volume increases."]
 
-        return suggestions
\ No newline at end of file
+        return suggestions
+
+    def _generate_trend_suggestions(self, period_deltas):
+        """
+        Generates suggestions from period-over-period KPI deltas.
+        Args:
+            period_deltas: The 'period_deltas' entry of the metrics dictionary.
+        Returns:
+            A list of suggestion strings (empty if there is no comparable history).
+        """
+        suggestions = []
+        for key, (_window_days, label, period_name) in DataProcessor.DELTA_PERIODS.items():
+            deltas = period_deltas.get(key)
+            if not deltas:
+                continue
+
+            # Trend 1: Weekend revenue momentum
+            weekend_current = deltas['saturday_revenue']['current'] + deltas['sunday_revenue']['current']
+            weekend_previous = deltas['saturday_revenue']['previous'] + deltas['sunday_revenue']['previous']
+            if weekend_previous > 0:
+                weekend_pct = (weekend_current - weekend_previous) / weekend_previous * 100
+                if weekend_pct <= -10:
+                    suggestions.append(
+                        f"📉 **Weekend Slowdown ({label})**: Weekend revenue fell **{abs(weekend_pct):.0f}%** versus last {period_name} "
+                        f"(**€{weekend_current:,.2f}** vs **€{weekend_previous:,.2f}**). Review weekend scheduling and consider a targeted weekend promotion to win back momentum."
+                    )
+                elif weekend_pct >= 10:
+                    suggestions.append(
+                        f"📈 **Weekend Surge ({label})**: Weekend revenue grew **{weekend_pct:.0f}%** versus last {period_name} "
+                        f"(**€{weekend_current:,.2f}** vs **€{weekend_previous:,.2f}**). Lock in this trend by ensuring staffing and class capacity keep pace with demand."
+                    )
+
+            # Trend 2: Premium member growth or churn
+            premium = deltas['premium_members']
+            if premium['change'] < 0:
+                suggestions.append(
+                    f"⚠️ **Premium Engagement Dip ({label})**: Active premium members dropped from **{premium['previous']}** to **{premium['current']}**. "
+                    f"Reach out to lapsed premium clients with personalised check-ins or loyalty perks before they churn."
+                )
+            elif premium['change'] > 0:
+                suggestions.append(
+                    f"👑 **Premium Momentum ({label})**: Active premium members rose from **{premium['previous']}** to **{premium['current']}**. "
+                    f"Capture what drove this growth and double down on it in your next campaign."
+                )
+
+            # Trend 3: Margin erosion on the top earner (only a trend if the top earner is the same service)
+            top_profit = deltas['avg_profit_most_profitable']
+            top_earner = deltas['most_profitable_service']
+            if top_earner['changed']:
+                suggestions.append(
+                    f"🏆 **New Profit Leader ({label})**: **{top_earner['current']}** has overtaken **{top_earner['previous']}** as your most profitable service, "
+                    f"averaging **€{top_profit['current']:.2f} profit per session** this {period_name}. Check whether the shift reflects stronger demand for {top_earner['current']} or a margin squeeze on {top_earner['previous']}."
+                )
+            elif top_profit['pct_change'] is not None and top_profit['pct_change'] <= -10:
+                suggestions.append(
+                    f"💸 **Margin Pressure ({label})**: Average profit on **{top_earner['current']}**, your top-earning service, slipped **{abs(top_profit['pct_change']):.0f}%** "
+                    f"to **€{top_profit['current']:.2f} per session**. Check recent session costs and pricing before the erosion compounds."
+                )
+
+            # Trend 4: Loss-making service recovery or deterioration (only a trend if it is the same service)
+            low_profit = deltas['avg_profit_least_profitable']
+            weakest_service = deltas['least_profitable_service']
+            if not weakest_service['changed']:
+                if low_profit['previous'] < 0 <= low_profit['current']:
+                    suggestions.append(
+                        f"✅ **Turnaround Spotted ({label})**: Your weakest service (**{weakest_service['current']}**) moved back into profit "
+                        f"at **€{low_profit['current']:.2f} per session**. Keep the recent cost and pricing changes in place."
+                    )
+                elif low_profit['current'] < 0 and low_profit['change'] < 0:
+                    suggestions.append(
+                        f"🚨 **Deepening Losses ({label})**: **{weakest_service['current']}** is now losing "
+                        f"**€{abs(low_profit['current']):.2f} per session**, worse than last {period_name}. Prioritise a pricing or cost review for this service."
+                    )
+
+            # Trend 5: Shift in demand leaders
+            if deltas['top_service_revenue']['changed']:
+                suggestions.append(
+                    f"🔀 **Demand Shift ({label})**: **{deltas['top_service_revenue']['current']}** overtook **{deltas['top_service_revenue']['previous']}** "
+                    f"as your top revenue service this {period_name}. Revisit class capacity and marketing spend to follow where clients are heading."
+                )
+            if deltas['peak_hour_overall']['changed']:
+                peak_hour = deltas['peak_hour_overall']['current']
+                previous_peak = deltas['peak_hour_overall']['previous']
+                suggestions.append(
+                    f"⏰ **Peak Hour Moved ({label})**: Your busiest hour shifted from **{previous_peak:02d}:00** to **{peak_hour:02d}:00**. "
+                    f"Realign staff rotas and class timetables with the new traffic pattern."
+                )
+
+            # Trend 6: Add-on sales trend on the weakest upsell service (only a trend if it is the same service)
+            addons = deltas['lowest_addon_avg']
+            weakest_upsell = deltas['service_low_addons']
+            if weakest_upsell['changed']:
+                suggestions.append(
+                    f"🛍️ **Upsell Laggard Changed ({label})**: **{weakest_upsell['current']}** has replaced **{weakest_upsell['previous']}** as your weakest add-on performer, "
+                    f"at **€{addons['current']:.2f}** per visit this {period_name}. Compare add-on offers and staff prompts across both services to see what changed."
+                )
+            elif addons['pct_change'] is not None and addons['pct_change'] >= 20:
+                suggestions.append(
+                    f"🛍️ **Upsell Gains ({label})**: **{weakest_upsell['current']}**, your weakest add-on performer, now averages **€{addons['current']:.2f}** per visit, "
+                    f"up **{addons['pct_change']:.0f}%** on last {period_name}. Roll the upselling tactics that worked here out to other services."
+                )
+
+        return suggestions
@@ -1,9 +1,27 @@
 from ai_suggestion_engine import AISuggestionEngine
+from data_processor import DataProcessor
 
 class DashboardRenderer:
     """
-    Handles the rendering of the dashboard elements: title, AI insights, and charts.
+    Handles the rendering of the dashboard elements: title, AI insights, KPI trends, and charts.
     """
+    # KPI tiles shown in the trends section: metric key -> (label, value format)
+    # A format of None marks a categorical KPI, whose delta shows the previous value instead
+    KPI_TILES = {
+        'saturday_revenue': ("Saturday Revenue", "€{:,.2f}"),
+        'sunday_revenue': ("Sunday Revenue", "€{:,.2f}"),
+        'premium_members': ("Active Premium Members", "{:,.0f}"),
+        'avg_profit_most_profitable': ("Top Avg Profit / Session", "€{:,.2f}"),
+        'avg_profit_least_profitable': ("Lowest Avg Profit / Session", "€{:,.2f}"),
+        'lowest_addon_avg': ("Lowest Add-on Avg / Visit", "€{:,.2f}"),
+        'top_day': ("Top Revenue Day", None),
+        'top_service_revenue': ("Top Revenue Service", None),
+        'most_profitable_service': ("Most Profitable Service", None),
+        'least_profitable_service': ("Least Profitable Service", None),
+        'peak_hour_overall': ("Peak Hour", None),
+        'service_low_addons': ("Weakest Add-on Service", None),
+    }
+
     def __init__(self):
         self.ai_engine = AISuggestionEngine()
 
@@ -16,6 +34,7 @@ class DashboardRenderer:
         """
         self._render_title(st_module)
         self._render_ai_insights(df, metrics, st_module, random_module)
+        self._render_kpi_deltas(metrics, st_module)
         if st_module: # Check if st_module is provided
             st_module.markdown("---") # Add a horizontal rule for separation
         else: # Fallback to global import if not provided (less ideal)
@@ -105,6 +124,38 @@ class DashboardRenderer:
             # Streamlit automatically re-renders the page after a button click.
             # The change in st.session_state.current_ai_suggestion will be picked up.
 
+    def _render_kpi_deltas(self, metrics, st_module=None):
+        """Displays week-over-week and month-over-month delta indicators for each KPI."""
+        if st_module is None: import streamlit as st_module # Fallback
+
+        period_deltas = (metrics or {}).get('period_deltas') or {}
+        available = [(key, label) for key, (_window_days, label, _period_name) in DataProcessor.DELTA_PERIODS.items() if period_deltas.get(key)]
+        if not available:
+            return
+
+        st_module.subheader("📊 KPI Trends")
+        tabs = st_module.tabs([label.capitalize() for _key, label in available])
+        for tab, (key, _label) in zip(tabs, available):
+            deltas = period_deltas[key]
+            with tab:
+                st_module.caption(f"{deltas['current_period']} vs {deltas['previous_period']}")
+                columns = st_module.columns(6)
+                for i, (metric_key, (label, value_format)) in enumerate(self.KPI_TILES.items()):
+                    delta = deltas[metric_key]
+                    with columns[i % len(columns)]:
+                        if value_format is None:
+                            current, previous = delta['current'], delta['previous']
+                            if metric_key == 'peak_hour_overall':
+                                current, previous = f"{current:02d}:00", f"{previous:02d}:00"
+                            st_module.metric(label, current,
+                                             delta=f"was {previous}" if delta['changed'] else None,
+                                             delta_color="off")
+                        else:
+                            delta_text = value_format.format(delta['change']).replace("€-", "-€")
+                            if delta['pct_change'] is not None:
+                                delta_text += f" ({delta['pct_change']:+.1f}%)"
+                            st_module.metric(label, value_format.format(delta['current']), delta=delta_text)
+
     def _render_charts(self, df, st_module=None, pd_module=None, px_module=None):
         """Renders the various charts for the dashboard."""
         if st_module is None: import streamlit as st_module # Fallback
@@ -1,9 +1,17 @@
+from datetime import timedelta
 
 class DataProcessor:
     """
     Handles data preprocessing and calculation of key metrics
     for the dashboard and AI insights.
     """
+    # Comparison windows for period-over-period deltas: key -> (window length in days, label, period name)
+    # Lengths are whole weeks so both windows hold the same number of each weekday
+    DELTA_PERIODS = {
+        'wow': (7, 'week-over-week', 'week'),
+        'mom': (28, 'month-over-month', 'month'),
+    }
+
     def process_and_calculate_metrics(self, df, pd_module=None, st_module=None):
         """
         Performs data preprocessing and calculates metrics.
@@ -40,7 +48,8 @@ class DataProcessor:
                     'saturday_revenue': 0,
                     'sunday_revenue': 0,
                     'service_low_addons': 'N/A',
-                    'lowest_addon_avg': 0.0
+                    'lowest_addon_avg': 0.0,
+                    'period_deltas': {key: None for key in self.DELTA_PERIODS}
                 }
             else:
                 top_day = df.groupby('Day')['Revenue'].sum().idxmax()
@@ -65,6 +74,13 @@ class DataProcessor:
                 service_low_addons = service_addon_per_visit.idxmin() if not service_addon_per_visit.empty else 'N/A'
                 lowest_addon_avg = service_addon_per_visit.min() if not service_addon_per_visit.empty else 0.0
 
+                # Trends are a best-effort extra: never let them discard the all-time metrics above
+                try:
+                    period_deltas = self._calculate_period_deltas(df)
+                except Exception as e:
+                    st_module.warning(f"⚠️ Could not calculate KPI trends: {e}")
+                    period_deltas = {key: None for key in self.DELTA_PERIODS}
+
                 metrics = {
                     'top_day': top_day,
                     'top_service_revenue': top_service,
@@ -77,11 +93,136 @@ class DataProcessor:
                     'saturday_revenue': saturday_revenue,
                     'sunday_revenue': sunday_revenue,
                     'service_low_addons': service_low_addons,
-                    'lowest_addon_avg': lowest_addon_avg
+                    'lowest_addon_avg': lowest_addon_avg,
+                    'period_deltas': period_deltas
                 }
 
             return df, metrics
 
         except Exception as e:
             st_module.error(f"❌ Error during data processing: {e}")
-            return None, None
\ No newline at end of file
+            return None, None
+
+    def _calculate_period_deltas(self, df):
+        """
+        Calculates week-over-week and month-over-month deltas for every KPI.
+        The data is bucketed by calendar day once and sorted; each comparison
+        window then tags those buckets as belonging to the latest N complete days
+        or the N days before, and derives all KPIs for both windows in a single
+        grouped pass.
+        Args:
+            df: The preprocessed Pandas DataFrame.
+        Returns:
+            A dictionary keyed by DELTA_PERIODS ('wow', 'mom'). Each value is None
+            when the data does not span two full windows or either window has no
+            rows, otherwise a dictionary with 'current_period', 'previous_period'
+            and a per-KPI entry holding
+            'current', 'previous', 'change' and 'pct_change' (numeric KPIs) or
+            'current', 'previous', 'changed' (categorical KPIs).
+        """
+        # --- Date-bucketed aggregates (one groupby over the raw rows) ---
+        buckets = df.groupby([df['Date'].dt.normalize().rename('Bucket'), 'Day', 'Service', 'Hour']).agg(
+            Revenue=('Revenue', 'sum'),
+            Profit=('Profit (€)', 'sum'),
+            Addons=('Add-on Sales (€)', 'sum'),
+            Visits=('Revenue', 'size')
+        ).reset_index().sort_values('Bucket')
+        # Unique member counts are not additive across days, so keep one row per premium member and day
+        premium = df.loc[df['Membership Type'] == 'Premium', ['Date', 'Client ID']]
+        premium = premium.assign(Bucket=premium['Date'].dt.normalize()).drop_duplicates(['Bucket', 'Client ID'])
+
+        # Windows span complete days only, so a partly exported first or last day never skews a comparison
+        first_day, last_day = self._complete_day_range(df['Date'])
+        buckets = buckets[buckets['Bucket'].between(first_day, last_day)]
+        premium = premium[premium['Bucket'].between(first_day, last_day)]
+        days_back = (last_day - buckets['Bucket']).dt.days
+        premium_days_back = (last_day - premium['Bucket']).dt.days
+
+        deltas = {}
+        for key, (window_days, _label, _period_name) in self.DELTA_PERIODS.items():
+            # Only compare when the previous window is fully covered by the data
+            if (last_day - first_day).days + 1 < 2 * window_days:
+                deltas[key] = None
+                continue
+
+            # Window 0 is the latest N days, window 1 the N days before it
+            window_index = days_back // window_days
+            window = buckets[window_index < 2].assign(Period=window_index)
+            # Gaps in the data (closures, missing exports) can leave a window without any rows
+            if window['Period'].nunique() < 2:
+                deltas[key] = None
+                continue
+            premium_index = premium_days_back // window_days
+
+            revenue_by_day = window.groupby(['Period', 'Day'])['Revenue'].sum()
+            by_service = window.groupby(['Period', 'Service'])[['Revenue', 'Profit', 'Addons', 'Visits']].sum()
+            profit_per_visit = by_service['Profit'] / by_service['Visits']
+            addons_per_visit = (by_service['Addons'] / by_service['Visits']).fillna(0)
+            visits_by_hour = window.groupby(['Period', 'Hour'])['Visits'].sum()
+            premium_members = premium[premium_index < 2].groupby(premium_index)['Client ID'].nunique()
+
+            kpis = {}
+            for period in (0, 1):
+                day_revenue = revenue_by_day.xs(period, level='Period')
+                service_profit = profit_per_visit.xs(period, level='Period')
+                service_addons = addons_per_visit.xs(period, level='Period')
+                kpis[period] = {
+                    'top_day': day_revenue.idxmax(),
+                    'top_service_revenue': by_service['Revenue'].xs(period, level='Period').idxmax(),
+                    'most_profitable_service': service_profit.idxmax(),
+                    'avg_profit_most_profitable': service_profit.max(),
+                    'least_profitable_service': service_profit.idxmin(),
+                    'avg_profit_least_profitable': service_profit.min(),
+                    'premium_members': premium_members.get(period, 0),
+                    'peak_hour_overall': visits_by_hour.xs(period, level='Period').idxmax(),
+                    'saturday_revenue': day_revenue.get('Saturday', 0),
+                    'sunday_revenue': day_revenue.get('Sunday', 0),
+                    'service_low_addons': service_addons.idxmin(),
+                    'lowest_addon_avg': service_addons.min()
+                }
+
+            period_delta = {
+                'current_period': self._format_window(last_day, window_days, 0),
+                'previous_period': self._format_window(last_day, window_days, 1)
+            }
+            for name, current in kpis[0].items():
+                previous = kpis[1][name]
+                if isinstance(current, str) or name == 'peak_hour_overall':
+                    period_delta[name] = {'current': current, 'previous': previous, 'changed': current != previous}
+                else:
+                    change = current - previous
+                    period_delta[name] = {
+                        'current': current,
+                        'previous': previous,
+                        'change': change,
+                        'pct_change': (change / abs(previous) * 100) if previous else None
+                    }
+            deltas[key] = period_delta
+
+        return deltas
+
+    def _complete_day_range(self, dates):
+        """
+        Finds the first and last calendar days fully covered by the data.
+        A boundary day counts as partial when its first session is later, or its
+        last session earlier, than the usual opening or closing hour across all days.
+        Args:
+            dates: The 'Date' column of the preprocessed DataFrame.
+        Returns:
+            A (first_day, last_day) tuple of normalized Timestamps.
+        """
+        days = dates.dt.normalize()
+        opening_hours = dates.groupby(days).min().dt.hour
+        closing_hours = dates.groupby(days).max().dt.hour
+        first_day, last_day = opening_hours.index[0], opening_hours.index[-1]
+        if opening_hours.iloc[0] > opening_hours.median():
+            first_day += timedelta(days=1)
+        if closing_hours.iloc[-1] < closing_hours.median():
+            last_day -= timedelta(days=1)
+        return first_day, last_day
+
+    def _format_window(self, last_day, window_days, window_index):
+        """Formats the date range covered by a trailing comparison window."""
+        window_end = last_day - timedelta(days=window_index * window_days)
+        window_start = window_end - timedelta(days=window_days - 1)
+        return f"{window_start:%d %b} – {window_end:%d %b %Y}"
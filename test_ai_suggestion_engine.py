@@ -0,0 +1,104 @@
+import unittest
+
+from ai_suggestion_engine import AISuggestionEngine
+
+
+def _numeric(current, previous):
+    change = current - previous
+    return {'current': current, 'previous': previous, 'change': change,
+            'pct_change': (change / abs(previous) * 100) if previous else None}
+
+
+def _categorical(current, previous):
+    return {'current': current, 'previous': previous, 'changed': current != previous}
+
+
+def _steady_deltas(**overrides):
+    """Week-over-week deltas where nothing moves enough to trigger a trend rule."""
+    deltas = {
+        'current_period': '08 Jan – 14 Jan 2024',
+        'previous_period': '01 Jan – 07 Jan 2024',
+        'top_day': _categorical('Monday', 'Monday'),
+        'top_service_revenue': _categorical('Yoga', 'Yoga'),
+        'most_profitable_service': _categorical('Yoga', 'Yoga'),
+        'avg_profit_most_profitable': _numeric(20.0, 20.0),
+        'least_profitable_service': _categorical('Zumba', 'Zumba'),
+        'avg_profit_least_profitable': _numeric(5.0, 5.0),
+        'premium_members': _numeric(10, 10),
+        'peak_hour_overall': _categorical(9, 9),
+        'saturday_revenue': _numeric(100.0, 100.0),
+        'sunday_revenue': _numeric(100.0, 100.0),
+        'service_low_addons': _categorical('Zumba', 'Zumba'),
+        'lowest_addon_avg': _numeric(2.0, 2.0),
+    }
+    deltas.update(overrides)
+    return {'wow': deltas, 'mom': None}
+
+
+class TrendSuggestionsTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = AISuggestionEngine()
+
+    def test_no_history_gives_no_trends(self):
+        self.assertEqual(self.engine._generate_trend_suggestions({'wow': None, 'mom': None}), [])
+
+    def test_steady_kpis_give_no_trends(self):
+        self.assertEqual(self.engine._generate_trend_suggestions(_steady_deltas()), [])
+
+    def test_margin_pressure_on_same_top_earner(self):
+        suggestions = self.engine._generate_trend_suggestions(
+            _steady_deltas(avg_profit_most_profitable=_numeric(15.0, 20.0)))
+        self.assertEqual(len(suggestions), 1)
+        self.assertIn("Margin Pressure", suggestions[0])
+        self.assertIn("25%", suggestions[0])
+
+    def test_new_top_earner_is_not_reported_as_margin_pressure(self):
+        suggestions = self.engine._generate_trend_suggestions(_steady_deltas(
+            most_profitable_service=_categorical('Pilates', 'Yoga'),
+            avg_profit_most_profitable=_numeric(15.0, 20.0)))
+        self.assertEqual(len(suggestions), 1)
+        self.assertIn("New Profit Leader", suggestions[0])
+        self.assertNotIn("Margin Pressure", suggestions[0])
+
+    def test_upsell_gains_on_same_service(self):
+        suggestions = self.engine._generate_trend_suggestions(
+            _steady_deltas(lowest_addon_avg=_numeric(3.0, 2.0)))
+        self.assertEqual(len(suggestions), 1)
+        self.assertIn("Upsell Gains", suggestions[0])
+
+    def test_new_weakest_upsell_service_is_not_reported_as_gains(self):
+        suggestions = self.engine._generate_trend_suggestions(_steady_deltas(
+            service_low_addons=_categorical('Yoga', 'Zumba'),
+            lowest_addon_avg=_numeric(3.0, 2.0)))
+        self.assertEqual(len(suggestions), 1)
+        self.assertIn("Upsell Laggard Changed", suggestions[0])
+
+    def test_deepening_losses_only_for_same_service(self):
+        same = self.engine._generate_trend_suggestions(
+            _steady_deltas(avg_profit_least_profitable=_numeric(-4.0, -2.0)))
+        self.assertIn("Deepening Losses", same[0])
+        different = self.engine._generate_trend_suggestions(_steady_deltas(
+            least_profitable_service=_categorical('Pilates', 'Zumba'),
+            avg_profit_least_profitable=_numeric(-4.0, -2.0)))
+        self.assertEqual(different, [])
+
+    def test_turnaround_only_for_same_service(self):
+        same = self.engine._generate_trend_suggestions(
+            _steady_deltas(avg_profit_least_profitable=_numeric(4.0, -2.0)))
+        self.assertEqual(len(same), 1)
+        self.assertIn("Turnaround Spotted", same[0])
+        self.assertIn("Zumba", same[0])
+        different = self.engine._generate_trend_suggestions(_steady_deltas(
+            least_profitable_service=_categorical('Pilates', 'Zumba'),
+            avg_profit_least_profitable=_numeric(4.0, -2.0)))
+        self.assertEqual(different, [])
+
+    def test_zero_previous_value_does_not_break_rules(self):
+        suggestions = self.engine._generate_trend_suggestions(_steady_deltas(
+            avg_profit_most_profitable=_numeric(15.0, 0.0),
+            lowest_addon_avg=_numeric(3.0, 0.0)))
+        self.assertEqual(suggestions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+import pandas as pd
+
+from data_processor import DataProcessor
+
+
+class _StubStreamlit:
+    """Collects messages that DataProcessor would display in Streamlit."""
+    def __init__(self):
+        self.messages = []
+
+    def error(self, message):
+        self.messages.append(message)
+
+    def warning(self, message):
+        self.messages.append(message)
+
+
+def _make_df(rows):
+    """Builds a raw DataFrame from (date, service, revenue, membership, add-on, session cost) tuples."""
+    return pd.DataFrame([
+        {
+            'Date': date,
+            'Client ID': client_id,
+            'Service': service,
+            'Revenue': revenue,
+            'Membership Type': membership,
+            'Add-on Sales (€)': add_on,
+            'Session Cost (€)': session_cost,
+        }
+        for client_id, (date, service, revenue, membership, add_on, session_cost) in enumerate(rows)
+    ])
+
+
+def _daily_rows(start, days, service='Yoga', revenue=20.0, membership='Standard', add_on=0, session_cost=10.0, hour=9):
+    """One session per day, at the given hour, for the given number of days."""
+    return [
+        (pd.Timestamp(start) + pd.Timedelta(days=i, hours=hour), service, revenue, membership, add_on, session_cost)
+        for i in range(days)
+    ]
+
+
+class PeriodDeltasTest(unittest.TestCase):
+    def setUp(self):
+        self.processor = DataProcessor()
+        self.st = _StubStreamlit()
+
+    def _process(self, rows):
+        df, metrics = self.processor.process_and_calculate_metrics(_make_df(rows), pd_module=pd, st_module=self.st)
+        self.assertIsNotNone(metrics, self.st.messages)
+        return metrics
+
+    def test_short_history_has_no_deltas(self):
+        metrics = self._process(_daily_rows('2024-01-01', 10))
+        self.assertEqual(metrics['period_deltas'], {'wow': None, 'mom': None})
+
+    def test_gap_in_previous_window_keeps_all_time_metrics(self):
+        rows = _daily_rows('2024-01-01', 1) + _daily_rows('2024-01-20', 2)
+        metrics = self._process(rows)
+        self.assertEqual(metrics['period_deltas'], {'wow': None, 'mom': None})
+        self.assertEqual(metrics['top_service_revenue'], 'Yoga')
+        self.assertEqual(self.st.messages, [])
+
+    def test_numeric_kpi_delta(self):
+        # Previous week: 7 sessions at €20; current week: 7 sessions at €30
+        rows = _daily_rows('2024-01-01', 7, revenue=20.0) + _daily_rows('2024-01-08', 7, revenue=30.0)
+        wow = self._process(rows)['period_deltas']['wow']
+        self.assertEqual(wow['current_period'], '08 Jan – 14 Jan 2024')
+        self.assertEqual(wow['previous_period'], '01 Jan – 07 Jan 2024')
+        self.assertAlmostEqual(wow['avg_profit_most_profitable']['previous'], 10.0)
+        self.assertAlmostEqual(wow['avg_profit_most_profitable']['current'], 20.0)
+        self.assertAlmostEqual(wow['avg_profit_most_profitable']['change'], 10.0)
+        self.assertAlmostEqual(wow['avg_profit_most_profitable']['pct_change'], 100.0)
+        self.assertAlmostEqual(wow['saturday_revenue']['change'], 10.0)
+
+    def test_constant_data_has_no_weekday_deltas(self):
+        # 62 days from a Monday: the windows start mid-week, so 30-day windows would differ in weekday counts
+        deltas = self._process(_daily_rows('2024-01-01', 62))['period_deltas']
+        for key in ('wow', 'mom'):
+            self.assertAlmostEqual(deltas[key]['saturday_revenue']['change'], 0.0)
+            self.assertAlmostEqual(deltas[key]['sunday_revenue']['change'], 0.0)
+            self.assertFalse(deltas[key]['top_day']['changed'])
+
+    def test_partial_boundary_days_are_excluded(self):
+        # Two full weeks open 07:00-20:00, plus an export that starts late on the day before and stops early on the day after
+        rows = (_daily_rows('2024-01-01', 14, hour=7) + _daily_rows('2024-01-01', 14, hour=20)
+                + _daily_rows('2023-12-31', 1, hour=20) + _daily_rows('2024-01-15', 1, hour=7))
+        wow = self._process(rows)['period_deltas']['wow']
+        self.assertEqual(wow['current_period'], '08 Jan – 14 Jan 2024')
+        self.assertEqual(wow['previous_period'], '01 Jan – 07 Jan 2024')
+        self.assertAlmostEqual(wow['sunday_revenue']['change'], 0.0)
+        self.assertAlmostEqual(wow['avg_profit_most_profitable']['change'], 0.0)
+
+    def test_zero_previous_value_has_no_pct_change(self):
+        rows = (_daily_rows('2024-01-01', 7, membership='Standard')
+                + _daily_rows('2024-01-08', 7, membership='Premium'))
+        premium = self._process(rows)['period_deltas']['wow']['premium_members']
+        self.assertEqual(premium['previous'], 0)
+        self.assertEqual(premium['current'], 7)
+        self.assertEqual(premium['change'], 7)
+        self.assertIsNone(premium['pct_change'])
+
+    def test_categorical_kpi_delta(self):
+        rows = _daily_rows('2024-01-01', 7, service='Yoga') + _daily_rows('2024-01-08', 7, service='Pilates')
+        wow = self._process(rows)['period_deltas']['wow']
+        self.assertEqual(wow['top_service_revenue'], {'current': 'Pilates', 'previous': 'Yoga', 'changed': True})
+        self.assertFalse(wow['peak_hour_overall']['changed'])
+        self.assertNotIn('pct_change', wow['top_day'])
+
+
+if __name__ == '__main__':
+    unittest.main()